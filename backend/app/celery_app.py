@@ -1,6 +1,10 @@
+import logging
 from celery import Celery
 from app.config import settings
 
+# Worker root logging comes from `-l`; this only tunes the app's own loggers
+logging.getLogger("app").setLevel(settings.log_level.upper())
+
 celery_app = Celery(
     "rss_podcast",
     broker=settings.redis_url,
@@ -8,6 +8,10 @@ class Settings(BaseSettings):
     google_api_key: Optional[str] = None
     text_model_name: str = "gemini-2.5-flash"
     tts_model_name: str = "gemini-2.5-flash-preview-tts"
+    log_level: str = "INFO"
+    # TTS API requests allowed per minute for each API key, across all workers
+    tts_requests_per_minute: int = 15
+    tts_chars_per_chunk: int = 2400
 
     class Config:
         env_file = ".env"
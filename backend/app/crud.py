@@ -158,7 +158,7 @@ async def validate_rss_url(url: str) -> dict:
             response.raise_for_status()
         
         # 3. Try to parse RSS
-        feed = feedparser.parse(response.text)
+        feed = feedparser.parse(response.content)
         
         # 4. Check if it's a valid RSS/Atom feed
         if not hasattr(feed, 'feed') or not feed.entries:
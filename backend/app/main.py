@@ -1,3 +1,6 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
@@ -5,6 +8,9 @@ from .config import settings
 from .database import engine, Base
 from .routers import auth, rss_sources, articles, podcasts, settings as settings_router
 
+logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logging.getLogger("app").setLevel(settings.log_level.upper())
+
 app = FastAPI()
 
 app.add_middleware(
@@ -19,6 +25,9 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 
 @app.on_event("startup")
 async def startup_event():
+    # Feed parsing is offloaded to the default executor, keep it bounded
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=8))
+    
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
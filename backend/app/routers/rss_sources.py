@@ -1,15 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from datetime import datetime, timedelta
-from sqlalchemy import select
+import logging
 
 from app import crud, schemas, models
 from app.database import get_db
 from .auth import get_current_active_user, oauth2_scheme
+from app.services import rss_parser
 from app.services.social_media_helper import SocialMediaRSSHelper
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 @router.post("/", response_model=schemas.RssSource, status_code=status.HTTP_201_CREATED)
 async def create_source(
@@ -77,33 +78,19 @@ async def refresh_all_sources(
     current_user: models.User = Depends(get_current_active_user)
 ):
     """Refresh all RSS sources for the current user."""
-    import asyncio
-    
     try:
         sources = await crud.get_sources_by_user(db, user_id=current_user.id)
         
         if not sources:
             return {"message": "No RSS sources found", "sources_refreshed": 0, "total_new_articles": 0}
         
-        total_new_articles = 0
-        sources_refreshed = 0
-        
-        print(f"🔄 Processing {len(sources)} RSS sources")
+        logger.info("🔄 Processing %d RSS sources", len(sources))
         
-        # Process sources one by one to avoid connection issues
-        for source in sources:
-            try:
-                result = await _process_single_source(source, db)
-                if result["status"] == "success":
-                    sources_refreshed += 1
-                    total_new_articles += result["new_articles"]
-                
-                # Small delay between sources
-                await asyncio.sleep(0.5)
-                
-            except Exception as e:
-                print(f"❌ Error processing source {source.id}: {e}")
-                continue
+        # Feeds fetched concurrently, then one commit with a savepoint per source
+        results = await rss_parser.refresh_sources(db, sources)
+        succeeded = [r for r in results if r["status"] == "success"]
+        sources_refreshed = len(succeeded)
+        total_new_articles = sum(r["new_articles"] for r in succeeded)
         
         return {
             "message": f"✅ Processed {len(sources)} sources: {sources_refreshed} successful",
@@ -133,8 +120,7 @@ async def refresh_all_sources(
 async def fetch_all_articles(
     token: str = Depends(oauth2_scheme)
 ):
-    """Fetch articles from all RSS sources for the current user with independent sessions."""
-    import asyncio
+    """Fetch articles from all RSS sources for the current user."""
     from app.database import AsyncSessionLocal
     from app.security import get_user_from_token
     
@@ -152,41 +138,15 @@ async def fetch_all_articles(
     if not sources:
         return {"message": "No RSS sources found", "sources_processed": 0, "total_new_articles": 0}
     
-    total_new_articles = 0
-    sources_processed = 0
-    results = []
+    logger.info("🔄 Fetching from %d RSS sources", len(sources))
     
-    print(f"🔄 Fetching from {len(sources)} RSS sources with independent sessions")
+    # Feeds fetched concurrently, then one session and one commit with a savepoint per source
+    async with AsyncSessionLocal() as db:
+        results = await rss_parser.refresh_sources(db, sources)
     
-    # Process each source with its own database session
-    for i, source in enumerate(sources):
-        try:
-            print(f"📦 Processing source {i+1}/{len(sources)}: {source.name or source.url}")
-            
-            # Create a fresh session for each source
-            async with AsyncSessionLocal() as source_db:
-                result = await _process_single_source(source, source_db)
-                results.append(result)
-                
-                if result["status"] == "success":
-                    sources_processed += 1
-                    total_new_articles += result["new_articles"]
-                    print(f"✅ Source {i+1} completed: {result['new_articles']} new articles")
-                else:
-                    print(f"❌ Source {i+1} failed: {result.get('error', 'Unknown error')}")
-            
-            # Brief pause between sources
-            await asyncio.sleep(0.3)
-            
-        except Exception as e:
-            print(f"❌ Error with source {i+1} ({source.name or source.url}): {e}")
-            results.append({
-                "source_name": source.name or source.url,
-                "error": str(e),
-                "new_articles": 0,
-                "status": "error"
-            })
-            continue
+    succeeded = [r for r in results if r["status"] == "success"]
+    sources_processed = len(succeeded)
+    total_new_articles = sum(r["new_articles"] for r in succeeded)
     
     # Return comprehensive results
     return {
@@ -197,153 +157,6 @@ async def fetch_all_articles(
         "details": results
     }
 
-async def _process_single_source(source, db: AsyncSession) -> dict:
-    """Process a single RSS source with robust error handling."""
-    import asyncio
-    
-    try:
-        print(f"🔄 Processing source: {source.name or source.url}")
-        
-        # Step 1: Fetch RSS feed (no database involved)
-        from app.services.rss_parser import fetch_rss_feed
-        fetched_articles = await fetch_rss_feed(source.url)
-        
-        if not fetched_articles:
-            return {"source_name": source.name or source.url, "new_articles": 0, "status": "success"}
-        
-        # Step 2: Process articles with 30-day limit
-        cutoff_date = datetime.now().replace(tzinfo=None) - timedelta(days=30)
-        print(f"📅 Cutoff date for 30-day filter: {cutoff_date}")
-        new_count = 0
-        skipped_old = 0
-        skipped_existing = 0
-        
-        # Process articles in small batches to avoid long transactions
-        batch_size = 5
-        articles_to_process = []
-        
-        # First, filter and prepare articles
-        for article_data in fetched_articles:
-            try:
-                article_url = article_data.get('article_url')
-                article_title = article_data.get('title')
-                
-                if not article_url or not article_title:
-                    continue
-                
-                # Handle timezone issues for published_date
-                published_date = article_data.get('published_date')
-                if published_date:
-                    if isinstance(published_date, str):
-                        try:
-                            from dateutil import parser
-                            published_date = parser.parse(published_date)
-                        except:
-                            published_date = datetime.now()
-                    
-                    if published_date.tzinfo is not None:
-                        published_date = published_date.replace(tzinfo=None)
-                    
-                    # Check if article is too old
-                    if published_date < cutoff_date:
-                        skipped_old += 1
-                        print(f"⏭️  Skipping old article: {published_date} < {cutoff_date}")
-                        continue
-                else:
-                    published_date = datetime.now()
-                
-                # **关键修复：确保所有必需字段都存在**
-                processed_article_data = {
-                    'title': article_data.get('title', 'Untitled'),
-                    'article_url': article_data.get('article_url', ''),
-                    'content': article_data.get('content', ''),
-                    'author': article_data.get('author', 'Unknown Author'),
-                    'published_date': published_date,
-                    'fetched_at': article_data.get('fetched_at') or datetime.now(),
-                    'summary': article_data.get('summary', ''),
-                    'source_id': source.id  # **关键：确保source_id存在**
-                }
-                
-                print(f"🔍 Prepared article data with keys: {list(processed_article_data.keys())}")
-                articles_to_process.append(processed_article_data)
-                
-            except Exception as e:
-                print(f"❌ Error preparing article data: {e}")
-                continue
-        
-        # Process articles in small batches
-        for i in range(0, len(articles_to_process), batch_size):
-            batch = articles_to_process[i:i + batch_size]
-            batch_new_count = 0
-            
-            try:
-                for article_data in batch:
-                    article_url = article_data.get('article_url')
-                    
-                    # Check if article already exists
-                    existing_check = select(models.Article).filter(
-                        models.Article.article_url == article_url,
-                        models.Article.source_id == source.id
-                    )
-                    result = await db.execute(existing_check)
-                    existing = result.scalars().first()
-                    
-                    if existing:
-                        skipped_existing += 1
-                        continue
-                    
-                    # **关键修复：直接验证ArticleCreate schema**
-                    try:
-                        # 先验证schema
-                        article_schema = schemas.ArticleCreate(**article_data)
-                        print(f"✅ Schema validation passed for: {article_data['title']}")
-                    except Exception as schema_error:
-                        print(f"❌ Schema validation failed for '{article_data.get('title', 'Unknown')}': {schema_error}")
-                        print(f"❌ Article data: {article_data}")
-                        continue
-                    
-                    # Create new article using the validated schema
-                    await crud.create_article(db, article=article_schema, source_id=source.id)
-                    batch_new_count += 1
-                
-                # Commit this batch
-                if batch_new_count > 0:
-                    await db.commit()
-                    new_count += batch_new_count
-                    print(f"✅ Committed batch: {batch_new_count} articles")
-                
-                # Small delay between batches
-                await asyncio.sleep(0.1)
-                
-            except Exception as e:
-                print(f"❌ Error in batch processing: {e}")
-                try:
-                    await db.rollback()
-                except:
-                    pass
-                # Continue to next batch instead of failing completely
-                continue
-        
-        print(f"📊 Source {source.name}: {new_count} new, {skipped_existing} existing, {skipped_old} too old")
-        return {"source_name": source.name or source.url, "new_articles": new_count, "status": "success"}
-        
-    except Exception as e:
-        error_msg = str(e)
-        print(f"❌ Error processing source {source.id}: {error_msg}")
-        
-        # Try to rollback, but don't fail if it doesn't work
-        try:
-            await db.rollback()
-        except:
-            pass
-        
-        return {
-            "source_name": source.name or source.url,
-            "error": error_msg,
-            "new_articles": 0,
-            "status": "error"
-        }
-
 @router.post("/{source_id}/fetch", status_code=status.HTTP_200_OK)
 async def fetch_articles_from_source(
     source_id: int,
@@ -357,11 +170,12 @@ async def fetch_articles_from_source(
         raise HTTPException(status_code=404, detail="RSS Source not found")
     
     try:
-        result = await _process_single_source(source, db)
+        result, = await rss_parser.refresh_sources(db, [source])
         
+        # source is expired by the commit; the result carries its name
         return {
-            "message": f"Fetch completed for {source.name or source.url}",
-            "source_name": source.name or source.url,
+            "message": f"Fetch completed for {result['source_name']}",
+            "source_name": result["source_name"],
             "new_articles": result["new_articles"],
             "status": result["status"]
         }
@@ -1,10 +1,13 @@
 import feedparser
 import asyncio
 import aiohttp
-from datetime import datetime, timezone
+import html
+import re
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Tuple
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, insert, and_
 from sqlalchemy.orm import selectinload
 import logging
 
@@ -13,6 +16,45 @@ from app.database import get_db
 
 logger = logging.getLogger(__name__)
 
+_ARTICLE_BATCH = TypeAdapter(List[schemas.ArticleCreate])
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+_SCRIPT_STYLE_RE = re.compile(r'<(?:script|style)\b', re.IGNORECASE)
+
+def clean_html_content(content: str) -> str:
+    """Strip HTML tags and collapse whitespace in a feed summary"""
+    if not content:
+        return ""
+    
+    if _SCRIPT_STYLE_RE.search(content):
+        # Script/style bodies need tree-aware stripping, regex would keep their text
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(content, 'html.parser')
+        for tag in soup(['script', 'style']):
+            tag.decompose()
+        text = soup.get_text(' ')
+    else:
+        text = html.unescape(_TAG_RE.sub(' ', content))
+    
+    text = _WS_RE.sub(' ', text).strip()
+    return text[:1000] + '...' if len(text) > 1000 else text
+
+def parse_publish_date(entry) -> datetime:
+    """Get an entry's publish time as UTC, falling back to now"""
+    # feedparser already normalizes these to UTC struct_time
+    time_struct = entry.get('published_parsed') or entry.get('updated_parsed')
+    if time_struct:
+        try:
+            published_date = datetime(*time_struct[:6], tzinfo=timezone.utc)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📅 Parsed publish time: %s", published_date)
+            return published_date
+        except (TypeError, ValueError) as e:
+            logger.warning("⚠️  Error parsing published time: %s", e)
+    
+    return datetime.now(timezone.utc)
+
 async def fetch_rss_feed(url: str) -> List[Dict]:
     """Fetch and parse RSS feed"""
     try:
@@ -20,23 +62,12 @@ async def fetch_rss_feed(url: str) -> List[Dict]:
         async with aiohttp.ClientSession(timeout=timeout) as session:
             async with session.get(url) as response:
                 if response.status == 200:
-                    content = await response.text()
-                    feed = feedparser.parse(content)
+                    content = await response.read()
+                    feed = await asyncio.get_running_loop().run_in_executor(None, feedparser.parse, content)
                     
                     articles = []
                     for entry in feed.entries:
-                        published_date = None
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            try:
-                                published_date = datetime(*entry.published_parsed[:6])
-                                if published_date.tzinfo is None:
-                                    published_date = published_date.replace(tzinfo=timezone.utc)
-                                print(f"📅 Parsed publish time: {published_date}")
-                            except (TypeError, ValueError) as e:
-                                print(f"⚠️  Error parsing published time: {e}")
-                                published_date = datetime.now(timezone.utc)
-                        else:
-                            published_date = datetime.now(timezone.utc)
+                        published_date = parse_publish_date(entry)
                         
                         content = ""
                         summary = ""
@@ -47,9 +78,10 @@ async def fetch_rss_feed(url: str) -> List[Dict]:
                             content = entry.description
                             
                         if hasattr(entry, 'summary'):
-                            summary = entry.summary
+                            summary = clean_html_content(entry.summary)
                         elif hasattr(entry, 'description'):
-                            summary = entry.description[:500] + "..." if len(entry.description) > 500 else entry.description
+                            summary = clean_html_content(entry.description)
+                            summary = summary[:500] + "..." if len(summary) > 500 else summary
                         
                         author = "Unknown Author"
                         if hasattr(entry, 'author'):
@@ -69,34 +101,47 @@ async def fetch_rss_feed(url: str) -> List[Dict]:
                         
                         articles.append(article_data)
                     
-                    print(f"✅ Successfully parsed {len(articles)} articles")
+                    logger.debug("✅ Successfully parsed %d articles", len(articles))
                     return articles
                 else:
-                    print(f"❌ Failed to fetch RSS feed: HTTP {response.status}")
+                    logger.warning("❌ Failed to fetch RSS feed: HTTP %s", response.status)
                     return []
                     
     except Exception as e:
-        print(f"❌ Error fetching RSS feed: {str(e)}")
+        logger.warning("❌ Error fetching RSS feed: %s", e)
         return []
 
+def _utc_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """UTC datetime without tzinfo, as stored in the naive DateTime columns"""
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 async def process_articles_for_source(
     db: AsyncSession,
     source: models.RssSource,
-    articles_data: List[Dict]
+    articles_data: List[Dict],
+    cutoff_date: Optional[datetime] = None
 ) -> Tuple[int, int, int]:
     """Process articles for a specific RSS source"""
     new_count = 0
     existing_count = 0
     old_count = 0
+    pending = []
     
-    cutoff_date = datetime.now(timezone.utc).replace(day=1).replace(month=datetime.now().month-1 if datetime.now().month > 1 else 12)
-    print(f"📅 Cutoff date for 30-day filter: {cutoff_date}")
+    if cutoff_date is None:
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=30)
+    logger.debug("📅 Cutoff date for 30-day filter: %s", cutoff_date)
+    cutoff_date = _utc_naive(cutoff_date)
     
     for article_data in articles_data:
         try:
-            published_date = article_data.get('published_date')
+            if not article_data.get('article_url') or not article_data.get('title'):
+                continue
+            
+            published_date = _utc_naive(article_data.get('published_date'))
             if published_date and published_date < cutoff_date:
-                print(f"⏭️  Skipping old article: {published_date} < {cutoff_date}")
+                logger.debug("⏭️  Skipping old article: %s < %s", published_date, cutoff_date)
                 old_count += 1
                 continue
             
@@ -118,51 +163,100 @@ async def process_articles_for_source(
                 'article_url': article_data.get('article_url', ''),
                 'content': article_data.get('content', ''),
                 'author': article_data.get('author', 'Unknown Author'),
-                'published_date': article_data.get('published_date'),
-                'fetched_at': article_data.get('fetched_at') or datetime.now(timezone.utc),
+                'published_date': published_date or _utc_naive(datetime.now(timezone.utc)),
+                'fetched_at': _utc_naive(article_data.get('fetched_at') or datetime.now(timezone.utc)),
                 'summary': article_data.get('summary', ''),
                 'source_id': source.id
             }
             
-            print(f"🔍 Creating article with data: {list(article_create_data.keys())}")
+            pending.append(article_create_data)
             
+        except Exception as e:
+            logger.warning("❌ Error processing individual article '%s': %s", article_data.get('title', 'Unknown'), e)
+            continue
+    
+    try:
+        validated = _ARTICLE_BATCH.validate_python(pending)
+    except ValidationError:
+        # Fall back to per-article validation so one bad entry doesn't drop the batch
+        validated = []
+        for article_create_data in pending:
             try:
-                article_create = schemas.ArticleCreate(**article_create_data)
-            except Exception as validation_error:
-                print(f"❌ Validation error for article '{article_data.get('title', 'Unknown')}': {validation_error}")
-                print(f"❌ Article data keys: {list(article_create_data.keys())}")
-                print(f"❌ Article data: {article_create_data}")
-                continue
+                validated.append(schemas.ArticleCreate(**article_create_data))
+            except ValidationError as validation_error:
+                logger.warning("❌ Validation error for article '%s': %s", article_create_data.get('title', 'Unknown'), validation_error)
+                logger.debug("❌ Article data: %s", article_create_data)
+    
+    rows = [
+        {
+            'title': article_create.title,
+            'content': article_create.content,
+            'article_url': article_create.article_url,
+            'author': article_create.author,
+            'published_date': article_create.published_date,
+            'fetched_at': article_create.fetched_at,
+            'source_id': source.id,
+            'summary': article_create.summary or '',
+            'is_read': False,
+            'read_at': None
+        }
+        for article_create in validated
+    ]
+    if rows:
+        # Bulk INSERT without building ORM objects or touching the identity map
+        await db.execute(insert(models.Article), rows)
+    new_count = len(validated)
+    
+    # The caller owns the transaction and commits once for all sources
+    logger.info("📊 Source %s: %d new, %d existing, %d too old", source.name, new_count, existing_count, old_count)
+    
+    return new_count, existing_count, old_count
+
+async def refresh_sources(db: AsyncSession, sources: List[models.RssSource]) -> List[Dict]:
+    """
+    Fetch the feeds of the given sources concurrently, then insert their new articles
+    with a SAVEPOINT per source and a single commit. Returns one result per source
+    """
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=30)
+    
+    # Fetch every feed before touching the session so no connection sits idle on HTTP
+    feeds = await asyncio.gather(
+        *(fetch_rss_feed(source.url) for source in sources),
+        return_exceptions=True
+    )
+    
+    results = []
+    for i, (source, articles_data) in enumerate(zip(sources, feeds), 1):
+        source_name = source.name or source.url
+        logger.debug("📦 Processing source %d/%d: %s", i, len(sources), source_name)
+        try:
+            if isinstance(articles_data, BaseException):
+                raise articles_data
             
-            new_article = models.Article(
-                title=article_create.title,
-                content=article_create.content,
-                article_url=article_create.article_url,
-                author=article_create.author,
-                published_date=article_create.published_date,
-                fetched_at=article_create.fetched_at,
-                source_id=source.id,
-                summary=article_create.summary or '',
-                is_read=False,
-                read_at=None
-            )
+            new_count = 0
+            if articles_data:
+                logger.debug("📰 RSS parsing result: %d articles", len(articles_data))
+                # SAVEPOINT per source so a failing source only rolls back its own inserts
+                async with db.begin_nested():
+                    new_count, existing_count, old_count = await process_articles_for_source(
+                        db, source, articles_data, cutoff_date
+                    )
+            else:
+                logger.info("⚠️  No articles found for source: %s", source_name)
             
-            db.add(new_article)
-            new_count += 1
+            results.append({"source_name": source_name, "new_articles": new_count, "status": "success"})
             
         except Exception as e:
-            print(f"❌ Error processing individual article '{article_data.get('title', 'Unknown')}': {str(e)}")
-            continue
+            logger.error("❌ Error processing source %s: %s", source_name, e)
+            results.append({"source_name": source_name, "error": str(e), "new_articles": 0, "status": "error"})
     
     try:
         await db.commit()
-        print(f"📊 Source {source.name}: {new_count} new, {existing_count} existing, {old_count} too old")
-    except Exception as e:
+    except Exception:
         await db.rollback()
-        print(f"❌ Error committing articles for source {source.name}: {str(e)}")
-        new_count = 0
+        raise
     
-    return new_count, existing_count, old_count
+    return results
 
 async def fetch_all_rss_sources(db: AsyncSession, user_id: int) -> Dict:
     """Fetch articles from all RSS sources for a user"""
@@ -179,52 +273,20 @@ async def fetch_all_rss_sources(db: AsyncSession, user_id: int) -> Dict:
                 "sources_processed": 0
             }
         
-        print(f"🔄 Fetching from {len(sources)} RSS sources with independent sessions")
+        logger.info("🔄 Fetching from %d RSS sources", len(sources))
         
-        total_new_articles = 0
-        sources_processed = 0
-        
-        for i, source in enumerate(sources, 1):
-            print(f"📦 Processing source {i}/{len(sources)}: {source.name}")
-            try:
-                from app.database import AsyncSessionLocal
-                async with AsyncSessionLocal() as source_db:
-                    print(f"🔄 Processing source: {source.name}")
-                    
-                    articles_data = await fetch_rss_feed(source.url)
-                    
-                    if not articles_data:
-                        print(f"⚠️  No articles found for source: {source.name}")
-                        continue
-                    
-                    print(f"📰 RSS parsing result: {len(articles_data)} articles")
-                    
-                    source_query = select(models.RssSource).where(models.RssSource.id == source.id)
-                    source_result = await source_db.execute(source_query)
-                    current_source = source_result.scalar_one()
-                    
-                    new_count, existing_count, old_count = await process_articles_for_source(
-                        source_db, current_source, articles_data
-                    )
-                    
-                    total_new_articles += new_count
-                    sources_processed += 1
-                    
-                    print(f"✅ Source {i} completed: {new_count} new articles")
-                    
-            except Exception as e:
-                print(f"❌ Error processing source {source.name}: {str(e)}")
-                continue
+        results = await refresh_sources(db, sources)
+        succeeded = [r for r in results if r["status"] == "success"]
         
         return {
             "success": True,
-            "message": f"Successfully processed {sources_processed} sources",
-            "total_new_articles": total_new_articles,
-            "sources_processed": sources_processed
+            "message": f"Successfully processed {len(succeeded)} sources",
+            "total_new_articles": sum(r["new_articles"] for r in succeeded),
+            "sources_processed": len(succeeded)
         }
         
     except Exception as e:
-        print(f"❌ Error in fetch_all_rss_sources: {str(e)}")
+        logger.error("❌ Error in fetch_all_rss_sources: %s", e)
         return {
             "success": False,
             "message": f"Error fetching RSS sources: {str(e)}",
@@ -239,8 +301,8 @@ async def validate_rss_url(url: str) -> schemas.RssValidationResult:
         async with aiohttp.ClientSession(timeout=timeout) as session:
             async with session.get(url) as response:
                 if response.status == 200:
-                    content = await response.text()
-                    feed = feedparser.parse(content)
+                    content = await response.read()
+                    feed = await asyncio.get_running_loop().run_in_executor(None, feedparser.parse, content)
                     
                     if feed.bozo:
                         return schemas.RssValidationResult(
@@ -1,6 +1,12 @@
 import google.genai as genai
 from app.config import settings
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlparse
+
+# Per-article content budget and story cap for the LLM prompt
+MAX_PROMPT_CONTENT_CHARS = 400
+MAX_PROMPT_ARTICLES = 40
 
 def create_script_prompt(articles: list) -> str:
     """Creates a morning news podcast script with source attribution."""
@@ -24,28 +30,30 @@ def create_script_prompt(articles: list) -> str:
         time_context = "wherever you are"
     
     # Build article content with author and source information
-    article_content = ""
+    articles = articles[:MAX_PROMPT_ARTICLES]
+    parts = []
     for i, article in enumerate(articles):
         if hasattr(article, 'title'):
             title = article.title
-            content = article.content
+            content = (article.content or '')[:MAX_PROMPT_CONTENT_CHARS]
             author = getattr(article, 'author', 'Unknown Author')
             source_url = getattr(article, 'article_url', '')
             # Extract source name from URL
             source_name = extract_source_name(source_url) if source_url else 'Unknown Source'
         else:
             title = article.get('title', 'Untitled')
-            content = article.get('content', '')
+            content = (article.get('content') or '')[:MAX_PROMPT_CONTENT_CHARS]
             author = article.get('author', 'Unknown Author')
             source_url = article.get('article_url', '')
             source_name = extract_source_name(source_url) if source_url else 'Unknown Source'
         
-        article_content += f"""📰 Story {i+1}: {title}
+        parts.append(f"""📰 Story {i+1}: {title}
 Author: {author}
 Source: {source_name}
 Content: {content}
 
-"""
+""")
+    article_content = "".join(parts)
     
     prompt = f"""
 You are a professional scriptwriter for "Daily Briefing" - a personalized morning news podcast. Create an engaging dialogue between two hosts:
@@ -92,44 +100,53 @@ Create a personalized morning news podcast script that makes listeners feel info
 """
     return prompt
 
+SOURCE_NAME_MAPPING = {
+    'techcrunch.com': 'TechCrunch',
+    'arstechnica.com': 'Ars Technica',
+    'theverge.com': 'The Verge',
+    'reuters.com': 'Reuters',
+    'bbc.com': 'BBC News',
+    'cnn.com': 'CNN',
+    'nytimes.com': 'New York Times',
+    'washingtonpost.com': 'Washington Post',
+    'github.com': 'GitHub',
+    'medium.com': 'Medium',
+    'dev.to': 'Dev.to',
+    'hackernews.ycombinator.com': 'Hacker News',
+    'news.ycombinator.com': 'Hacker News'
+}
+
 def extract_source_name(url: str) -> str:
     """Extract readable source name from URL."""
     if not url:
         return "Unknown Source"
     
     try:
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-     
-        if domain.startswith('www.'):
-            domain = domain[4:]
-        
-        source_mapping = {
-            'techcrunch.com': 'TechCrunch',
-            'arstechnica.com': 'Ars Technica',
-            'theverge.com': 'The Verge',
-            'reuters.com': 'Reuters',
-            'bbc.com': 'BBC News',
-            'cnn.com': 'CNN',
-            'nytimes.com': 'New York Times',
-            'washingtonpost.com': 'Washington Post',
-            'github.com': 'GitHub',
-            'medium.com': 'Medium',
-            'dev.to': 'Dev.to',
-            'hackernews.ycombinator.com': 'Hacker News',
-            'news.ycombinator.com': 'Hacker News'
-        }
-        
-        if domain in source_mapping:
-            return source_mapping[domain]
-        
-        clean_name = domain.replace('.com', '').replace('.org', '').replace('.net', '')
-        return clean_name.replace('.', ' ').title()
-        
+        domain = urlparse(url).netloc.lower().removeprefix('www.')
+        return _source_name_from_domain(domain)
     except Exception:
         return "Unknown Source"
 
+@lru_cache(maxsize=4096)
+def _source_name_from_domain(domain: str) -> str:
+    """Map a bare domain to a readable source name (cached per domain)."""
+    if domain in SOURCE_NAME_MAPPING:
+        return SOURCE_NAME_MAPPING[domain]
+    
+    clean_name = domain.replace('.com', '').replace('.org', '').replace('.net', '')
+    return clean_name.replace('.', ' ').title()
+
+def ensure_script_opening(script: str) -> str:
+    """Makes sure the script opens with Joe's greeting."""
+    if script.startswith("Joe:"):
+        return script
+    
+    print("⚠️ Adjusting script format...")
+    current_hour = datetime.now().hour
+    greeting = "Good morning" if 5 <= current_hour < 12 else "Hello"
+    today = datetime.now().strftime("%B %d, %Y")
+    return f"Joe: {greeting}, and welcome to your Daily Briefing for {today}.\n\n" + script
+
 def generate_script_from_articles(articles: list, api_key: str = None) -> str:
     """Generates a personalized morning news podcast script."""
     print(f"🌅 Generating personalized morning briefing for {len(articles)} stories...")
@@ -146,14 +163,7 @@ def generate_script_from_articles(articles: list, api_key: str = None) -> str:
             contents=[prompt]
         )
         
-        script = response.text.strip()
-        
-        if not script.startswith("Joe:"):
-            print("⚠️ Adjusting script format...")
-            current_hour = datetime.now().hour
-            greeting = "Good morning" if 5 <= current_hour < 12 else "Hello"
-            today = datetime.now().strftime("%B %d, %Y")
-            script = f"Joe: {greeting}, and welcome to your Daily Briefing for {today}.\n\n" + script
+        script = ensure_script_opening(response.text.strip())
         
         print(f"✅ Morning briefing script generated: {len(script)} characters")
         print(f"📊 Stories covered: {len(articles)}")
@@ -164,17 +174,61 @@ def generate_script_from_articles(articles: list, api_key: str = None) -> str:
         print(f"❌ Script generation failed: {e}")
         return create_fallback_morning_script(articles)
 
+async def stream_script_from_articles(articles: list, api_key: str = None):
+    """Streams the morning podcast script as it is generated, yielding pieces of text."""
+    print(f"🌅 Streaming personalized morning briefing for {len(articles)} stories...")
+    
+    prompt = create_script_prompt(articles)
+    client = genai.Client(api_key=api_key or settings.google_api_key)
+    
+    # The opening is held back until there is enough text to check it starts with "Joe:"
+    head = ""
+    streamed = 0
+    try:
+        async for chunk in await client.aio.models.generate_content_stream(
+            model=settings.text_model_name,
+            contents=[prompt]
+        ):
+            text = chunk.text or ""
+            if head is not None:
+                head += text
+                if len(head.lstrip()) < len("Joe:"):
+                    continue
+                text, head = ensure_script_opening(head.lstrip()), None
+            streamed += len(text)
+            yield text
+    except Exception as e:
+        print(f"❌ Script generation failed: {e}")
+        if streamed:
+            # Part of the script is already out; a truncated briefing must not pass as complete
+            raise Exception(f"Script stream interrupted after {streamed} characters: {e}") from e
+        yield create_fallback_morning_script(articles)
+        return
+    
+    if head is not None:
+        # Stream ended before the opening was complete
+        if head.strip():
+            text = ensure_script_opening(head.strip())
+            streamed += len(text)
+            yield text
+        else:
+            yield create_fallback_morning_script(articles)
+            return
+    
+    print(f"✅ Morning briefing script streamed: {streamed} characters")
+    print(f"📊 Stories covered: {len(articles)}")
+
 def create_fallback_morning_script(articles: list) -> str:
     """Creates a fallback morning news script."""
     today = datetime.now().strftime("%B %d, %Y")
     current_hour = datetime.now().hour
     greeting = "Good morning" if 5 <= current_hour < 12 else "Hello"
     
-    script = f"""Joe: {greeting}, and welcome to your Daily Briefing for {today}. I'm Joe, and I'm here with Jane to bring you the latest from your personalized news sources.
+    parts = [f"""Joe: {greeting}, and welcome to your Daily Briefing for {today}. I'm Joe, and I'm here with Jane to bring you the latest from your personalized news sources.
 
 Jane: That's right, Joe. We've gathered {len(articles)} stories from your RSS feeds to keep you informed as you start your day.
 
-"""
+"""]
     
     for i, article in enumerate(articles):
         if isinstance(article, dict):
@@ -188,16 +242,16 @@ Jane: That's right, Joe. We've gathered {len(articles)} stories from your RSS fe
         
         source_name = extract_source_name(source_url)
         
-        script += f"""Joe: Let's dive into story number {i+1} - {title}.
+        parts.append(f"""Joe: Let's dive into story number {i+1} - {title}.
 
 Jane: This comes to us from {author} at {source_name}. Here's what you need to know...
 
-"""
+""")
     
-    script += f"""Joe: That's your briefing for this {greeting.lower()}. Stay informed, stay curious.
+    parts.append(f"""Joe: That's your briefing for this {greeting.lower()}. Stay informed, stay curious.
 
 Jane: Have a great day ahead, and we'll catch you tomorrow with more news from your sources.
 
-Joe: This has been your Daily Briefing. Take care!"""
+Joe: This has been your Daily Briefing. Take care!""")
     
-    return script
\ No newline at end of file
+    return "".join(parts)
\ No newline at end of file
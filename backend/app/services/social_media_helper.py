@@ -1,6 +1,186 @@
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import ParseResult, urlparse, parse_qs
+
+_HOST_TO_PLATFORM = {
+    'instagram.com': 'instagram',
+    'youtube.com': 'youtube',
+    'github.com': 'github',
+    'twitter.com': 'twitter',
+    'x.com': 'x',
+    'tiktok.com': 'tiktok',
+    'bilibili.com': 'bilibili',
+    'weibo.com': 'weibo',
+    'zhihu.com': 'zhihu',
+    'pixiv.net': 'pixiv',
+    'reddit.com': 'reddit',
+}
+
+# Matched against the URL path only, the host is resolved via _HOST_TO_PLATFORM
+_USERNAME_PATTERNS: Dict[str, re.Pattern] = {
+    platform: re.compile(pattern, re.IGNORECASE)
+    for platform, pattern in {
+        'instagram': r'^/([^/]+)',
+        'youtube': r'^/(?:channel/|c/|@)?([^/]+)',
+        'github': r'^/([^/]+)',
+        'twitter': r'^/([^/]+)',
+        'x': r'^/([^/]+)',
+        'tiktok': r'^/@([^/]+)',
+        'bilibili': r'^/video/([^/]+)',
+        'weibo': r'^/u/([^/]+)',
+        'zhihu': r'^/people/([^/]+)',
+        'pixiv': r'^/users/([^/]+)',
+        'reddit': r'^/r/([^/]+)',
+    }.items()
+}
+
+def _lookup_platform(parsed: ParseResult) -> Optional[str]:
+    # Walk the hostname's dot-suffixes longest first so any subdomain
+    # (www., m., mobile., ...) resolves to its registered platform host
+    labels = (parsed.hostname or '').split('.')
+    for i in range(len(labels) - 1):
+        platform = _HOST_TO_PLATFORM.get('.'.join(labels[i:]))
+        if platform:
+            return platform
+    return None
+
+# (path, title, description) format strings per platform; {username} is filled per call
+_ROUTE_TEMPLATES: Dict[str, List[Tuple[str, str, str]]] = {
+    'instagram': [
+        ("/instagram/user/{username}", "@{username} - Instagram Posts", "Recent posts from user's profile"),
+    ],
+    'twitter': [
+        ("/twitter/user/{username}", "@{username} - Twitter/X Posts", "User timeline tweets"),
+        ("/twitter/user/{username}/media", "@{username} - Twitter/X Media", "Media posts only"),
+    ],
+    'youtube': [
+        ("/youtube/user/{username}", "{username} - YouTube Channel", "Latest videos from channel"),
+    ],
+    'youtube_channel': [
+        ("/youtube/channel/{username}", "{username} - YouTube Channel", "Latest videos from channel"),
+    ],
+    'github': [
+        ("/github/user/repo/{username}", "{username} - GitHub Repositories", "New repositories and updates"),
+        ("/github/user/followers/{username}", "{username} - GitHub Followers", "New followers"),
+    ],
+    'tiktok': [
+        ("/tiktok/user/{username}", "@{username} - TikTok Posts", "Recent TikTok videos"),
+    ],
+    'bilibili': [
+        ("/bilibili/user/video/{username}", "{username} - Bilibili Videos", "Latest videos from user"),
+        ("/bilibili/user/dynamic/{username}", "{username} - Bilibili Dynamics", "User dynamics and updates"),
+    ],
+    'weibo': [
+        ("/weibo/user/{username}", "{username} - Weibo Posts", "Recent Weibo posts"),
+    ],
+    'zhihu': [
+        ("/zhihu/people/activities/{username}", "{username} - Zhihu Activities", "User activities and posts"),
+        ("/zhihu/people/answers/{username}", "{username} - Zhihu Answers", "User answers to questions"),
+    ],
+    'pixiv': [
+        ("/pixiv/user/{username}", "{username} - Pixiv Artworks", "Latest artworks from user"),
+    ],
+    'reddit': [
+        ("/reddit/r/{username}", "r/{username} - Reddit", "Latest posts from subreddit"),
+    ],
+}
+_ROUTE_TEMPLATES['x'] = _ROUTE_TEMPLATES['twitter']
+
+@lru_cache(maxsize=2048)
+def _username_from_path(platform: str, path: str) -> Optional[str]:
+    """Username/identifier from a URL path, memoized per (platform, path)"""
+    pattern = _USERNAME_PATTERNS.get(platform)
+    if not pattern:
+        return None
+    
+    match = pattern.match(path)
+    return match.group(1) if match else None
+
+def _platform_and_username(parsed: ParseResult) -> Tuple[Optional[str], Optional[str]]:
+    """(platform, username) for an already-parsed URL; platform is None if unsupported"""
+    platform = _lookup_platform(parsed)
+    if not platform:
+        return None, None
+    
+    return platform, _username_from_path(platform, parsed.path)
+
+@lru_cache(maxsize=4)
+def _route_templates_for(base: str) -> Dict[str, List[Tuple[str, str, str]]]:
+    """Route templates with the RSSHub base URL already joined in"""
+    return {
+        key: [(base + path, title, description) for path, title, description in templates]
+        for key, templates in _ROUTE_TEMPLATES.items()
+    }
+
+def _template_key(platform: str, username: str) -> str:
+    # YouTube channel IDs are 24 chars starting with UC, anything else is a username/custom URL
+    if platform == 'youtube' and username.startswith('UC') and len(username) == 24:
+        return 'youtube_channel'
+    return platform
+
+_PLATFORM_INFO = {
+    'instagram': {
+        'name': 'Instagram',
+        'description': 'User posts and tagged content',
+        'routes': ['user posts', 'tagged posts'],
+        'example_url': 'https://instagram.com/username'
+    },
+    'twitter': {
+        'name': 'Twitter/X',
+        'description': 'Tweets, media, and timeline',
+        'routes': ['timeline', 'media only', 'likes', 'lists'],
+        'example_url': 'https://twitter.com/username'
+    },
+    'youtube': {
+        'name': 'YouTube',
+        'description': 'Channel videos and playlists',
+        'routes': ['channel videos', 'playlists', 'community posts'],
+        'example_url': 'https://youtube.com/channel/UC...'
+    },
+    'github': {
+        'name': 'GitHub',
+        'description': 'Repositories, releases, and activity',
+        'routes': ['repositories', 'releases', 'followers', 'starred'],
+        'example_url': 'https://github.com/username'
+    },
+    'tiktok': {
+        'name': 'TikTok',
+        'description': 'User videos and posts',
+        'routes': ['user videos'],
+        'example_url': 'https://tiktok.com/@username'
+    },
+    'bilibili': {
+        'name': 'Bilibili',
+        'description': 'Videos and user dynamics',
+        'routes': ['videos', 'dynamics', 'bangumi'],
+        'example_url': 'https://bilibili.com/video/...'
+    },
+    'weibo': {
+        'name': 'Weibo',
+        'description': 'Chinese microblogging platform',
+        'routes': ['user posts', 'hot topics', 'search'],
+        'example_url': 'https://weibo.com/u/...'
+    },
+    'zhihu': {
+        'name': 'Zhihu',
+        'description': 'Chinese Q&A platform',
+        'routes': ['activities', 'answers', 'articles'],
+        'example_url': 'https://zhihu.com/people/username'
+    },
+    'pixiv': {
+        'name': 'Pixiv',
+        'description': 'Artwork sharing platform',
+        'routes': ['user artworks', 'rankings', 'bookmarks'],
+        'example_url': 'https://pixiv.net/users/...'
+    },
+    'reddit': {
+        'name': 'Reddit',
+        'description': 'Discussion forums and communities',
+        'routes': ['subreddit posts', 'user posts'],
+        'example_url': 'https://reddit.com/r/subreddit'
+    }
+}
 
 class SocialMediaRSSHelper:
     """
@@ -18,300 +198,95 @@ class SocialMediaRSSHelper:
     
     RSSHUB_BASE = RSSHUB_LOCAL
     
-    PLATFORM_PATTERNS = {
-        'instagram': r'instagram\.com/([^/]+)',
-        'youtube': r'youtube\.com/(?:channel/|c/|@)?([^/]+)',
-        'github': r'github\.com/([^/]+)',
-        'twitter': r'twitter\.com/([^/]+)',
-        'x': r'x\.com/([^/]+)',
-        'tiktok': r'tiktok\.com/@([^/]+)',
-        'bilibili': r'bilibili\.com/video/([^/]+)',
-        'weibo': r'weibo\.com/u/([^/]+)',
-        'zhihu': r'zhihu\.com/people/([^/]+)',
-        'pixiv': r'pixiv\.net/users/([^/]+)',
-        'reddit': r'reddit\.com/r/([^/]+)',
-    }
-    
     @classmethod
     def detect_platform(cls, url: str) -> Optional[str]:
         """
         Detect social media platform from URL
         """
-        for platform, pattern in cls.PLATFORM_PATTERNS.items():
-            if re.search(pattern, url.lower()):
-                return platform
-        return None
+        return _lookup_platform(urlparse(url))
     
     @classmethod
     def extract_username(cls, url: str, platform: str) -> Optional[str]:
         """
         Extract username/identifier from social media URL
         """
-        pattern = cls.PLATFORM_PATTERNS.get(platform)
-        if not pattern:
-            return None
-            
-        match = re.search(pattern, url.lower())
-        return match.group(1) if match else None
+        return _username_from_path(platform, urlparse(url).path)
     
     @classmethod
-    def generate_rsshub_routes(cls, platform: str, username: str) -> List[Dict[str, str]]:
+    def generate_rsshub_routes(cls, platform: str, username: str, base: Optional[str] = None) -> List[Dict[str, str]]:
         """
         Generate possible RSSHub routes for a platform and username
         Returns list of route options with descriptions
         """
-        routes = []
-        base = cls.RSSHUB_BASE
-        
-        if platform == 'instagram':
-            routes = [
-                {
-                    'url': f"{base}/instagram/user/{username}",
-                    'title': f"@{username} - Instagram Posts",
-                    'description': "Recent posts from user's profile"
-                }
-            ]
-        
-        elif platform in ['twitter', 'x']:
-            routes = [
-                {
-                    'url': f"{base}/twitter/user/{username}",
-                    'title': f"@{username} - Twitter/X Posts",
-                    'description': "User timeline tweets"
-                },
-                {
-                    'url': f"{base}/twitter/user/{username}/media",
-                    'title': f"@{username} - Twitter/X Media",
-                    'description': "Media posts only"
-                }
-            ]
-        
-        elif platform == 'youtube':
-            # Handle different YouTube URL formats
-            if username.startswith('UC') and len(username) == 24:
-                # Channel ID format
-                routes = [
-                    {
-                        'url': f"{base}/youtube/channel/{username}",
-                        'title': f"{username} - YouTube Channel",
-                        'description': "Latest videos from channel"
-                    }
-                ]
-            else:
-                # Username or custom URL
-                routes = [
-                    {
-                        'url': f"{base}/youtube/user/{username}",
-                        'title': f"{username} - YouTube Channel",
-                        'description': "Latest videos from channel"
-                    }
-                ]
-        
-        elif platform == 'github':
-            routes = [
-                {
-                    'url': f"{base}/github/user/repo/{username}",
-                    'title': f"{username} - GitHub Repositories",
-                    'description': "New repositories and updates"
-                },
-                {
-                    'url': f"{base}/github/user/followers/{username}",
-                    'title': f"{username} - GitHub Followers",
-                    'description': "New followers"
-                }
-            ]
-        
-        elif platform == 'tiktok':
-            routes = [
-                {
-                    'url': f"{base}/tiktok/user/{username}",
-                    'title': f"@{username} - TikTok Posts",
-                    'description': "Recent TikTok videos"
-                }
-            ]
-        
-        elif platform == 'bilibili':
-            routes = [
-                {
-                    'url': f"{base}/bilibili/user/video/{username}",
-                    'title': f"{username} - Bilibili Videos",
-                    'description': "Latest videos from user"
-                },
-                {
-                    'url': f"{base}/bilibili/user/dynamic/{username}",
-                    'title': f"{username} - Bilibili Dynamics",
-                    'description': "User dynamics and updates"
-                }
-            ]
-        
-        elif platform == 'weibo':
-            routes = [
-                {
-                    'url': f"{base}/weibo/user/{username}",
-                    'title': f"{username} - Weibo Posts",
-                    'description': "Recent Weibo posts"
-                }
-            ]
-        
-        elif platform == 'zhihu':
-            routes = [
-                {
-                    'url': f"{base}/zhihu/people/activities/{username}",
-                    'title': f"{username} - Zhihu Activities",
-                    'description': "User activities and posts"
-                },
-                {
-                    'url': f"{base}/zhihu/people/answers/{username}",
-                    'title': f"{username} - Zhihu Answers",
-                    'description': "User answers to questions"
-                }
-            ]
-        
-        elif platform == 'pixiv':
-            routes = [
-                {
-                    'url': f"{base}/pixiv/user/{username}",
-                    'title': f"{username} - Pixiv Artworks",
-                    'description': "Latest artworks from user"
-                }
-            ]
-        
-        elif platform == 'reddit':
-            routes = [
-                {
-                    'url': f"{base}/reddit/r/{username}",
-                    'title': f"r/{username} - Reddit",
-                    'description': "Latest posts from subreddit"
-                }
-            ]
+        templates = _route_templates_for(base or cls.RSSHUB_BASE).get(_template_key(platform, username), [])
+        return [
+            {'url': url.format(username=username), 'title': title.format(username=username), 'description': description}
+            for url, title, description in templates
+        ]
+    
+    @classmethod
+    def analyze(cls, url: str) -> Optional[Tuple[str, str, List[Dict[str, str]]]]:
+        """
+        Parse a social media URL once and return (platform, username, routes)
+        """
+        platform, username = _platform_and_username(urlparse(url))
+        if not username:
+            return None
         
-        return routes
+        return platform, username, cls.generate_rsshub_routes(platform, username)
     
     @classmethod
     def suggest_rss_sources(cls, url: str) -> List[Dict[str, str]]:
         """
         Given a social media URL, suggest possible RSS feeds
         """
-        platform = cls.detect_platform(url)
-        if not platform:
-            return []
-        
-        username = cls.extract_username(url, platform)
-        if not username:
-            return []
-        
-        return cls.generate_rsshub_routes(platform, username)
+        analysis = cls.analyze(url)
+        return analysis[2] if analysis else []
     
     @classmethod
     def validate_social_url(cls, url: str) -> Dict:
         """
         Validate and analyze a social media URL
         """
-        try:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                return {
-                    'valid': False,
-                    'error': 'Invalid URL format',
-                    'suggestions': []
-                }
-            
-            platform = cls.detect_platform(url)
-            if not platform:
-                return {
-                    'valid': False,
-                    'error': 'Unsupported social media platform',
-                    'suggestions': []
-                }
-            
-            username = cls.extract_username(url, platform)
-            if not username:
-                return {
-                    'valid': False,
-                    'error': 'Could not extract username/identifier',
-                    'suggestions': []
-                }
-            
-            suggestions = cls.generate_rsshub_routes(platform, username)
-            
-            return {
-                'valid': True,
-                'platform': platform,
-                'username': username,
-                'suggestions': suggestions
-            }
-        
-        except Exception as e:
+        platform, username, error = _classify_social_url(url)
+        if error:
             return {
                 'valid': False,
-                'error': f'URL parsing failed: {str(e)}',
+                'error': error,
                 'suggestions': []
             }
+        
+        # Fresh dict per call; only the (platform, username, error) tuple is cached
+        return {
+            'valid': True,
+            'platform': platform,
+            'username': username,
+            'suggestions': cls.generate_rsshub_routes(platform, username)
+        }
     
     @classmethod
     def get_platform_info(cls) -> Dict:
         """
         Get information about supported platforms
         """
-        return {
-            'instagram': {
-                'name': 'Instagram',
-                'description': 'User posts and tagged content',
-                'routes': ['user posts', 'tagged posts'],
-                'example_url': 'https://instagram.com/username'
-            },
-            'twitter': {
-                'name': 'Twitter/X',
-                'description': 'Tweets, media, and timeline',
-                'routes': ['timeline', 'media only', 'likes', 'lists'],
-                'example_url': 'https://twitter.com/username'
-            },
-            'youtube': {
-                'name': 'YouTube',
-                'description': 'Channel videos and playlists',
-                'routes': ['channel videos', 'playlists', 'community posts'],
-                'example_url': 'https://youtube.com/channel/UC...'
-            },
-            'github': {
-                'name': 'GitHub',
-                'description': 'Repositories, releases, and activity',
-                'routes': ['repositories', 'releases', 'followers', 'starred'],
-                'example_url': 'https://github.com/username'
-            },
-            'tiktok': {
-                'name': 'TikTok',
-                'description': 'User videos and posts',
-                'routes': ['user videos'],
-                'example_url': 'https://tiktok.com/@username'
-            },
-            'bilibili': {
-                'name': 'Bilibili',
-                'description': 'Videos and user dynamics',
-                'routes': ['videos', 'dynamics', 'bangumi'],
-                'example_url': 'https://bilibili.com/video/...'
-            },
-            'weibo': {
-                'name': 'Weibo',
-                'description': 'Chinese microblogging platform',
-                'routes': ['user posts', 'hot topics', 'search'],
-                'example_url': 'https://weibo.com/u/...'
-            },
-            'zhihu': {
-                'name': 'Zhihu',
-                'description': 'Chinese Q&A platform',
-                'routes': ['activities', 'answers', 'articles'],
-                'example_url': 'https://zhihu.com/people/username'
-            },
-            'pixiv': {
-                'name': 'Pixiv',
-                'description': 'Artwork sharing platform',
-                'routes': ['user artworks', 'rankings', 'bookmarks'],
-                'example_url': 'https://pixiv.net/users/...'
-            },
-            'reddit': {
-                'name': 'Reddit',
-                'description': 'Discussion forums and communities',
-                'routes': ['subreddit posts', 'user posts'],
-                'example_url': 'https://reddit.com/r/subreddit'
-            }
-        }
+        return _PLATFORM_INFO
+
+@lru_cache(maxsize=4096)
+def _classify_social_url(url: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """(platform, username, error) for a URL, memoized; immutable so it can be shared"""
+    try:
+        parsed = urlparse(url)
+        if not parsed.scheme or not parsed.netloc:
+            return None, None, 'Invalid URL format'
+        
+        # Reuse the parse above for platform and username
+        platform, username = _platform_and_username(parsed)
+        if not platform:
+            return None, None, 'Unsupported social media platform'
+        if not username:
+            return platform, None, 'Could not extract username/identifier'
+        
+        return platform, username, None
+    
+    except Exception as e:
+        return None, None, f'URL parsing failed: {str(e)}'
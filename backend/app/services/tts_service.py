@@ -1,61 +1,166 @@
 import google.genai as genai
 from google.genai import types
-import wave
+from google.genai import errors as genai_errors
+import httpx
+import redis.asyncio as aioredis
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+import struct
 import time
 import asyncio
+import hashlib
+import logging
+import random
+import re
+import weakref
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from pathlib import Path
 from fastapi import HTTPException
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 PODCASTS_DIR = Path("podcasts")
-PODCASTS_DIR.mkdir(exist_ok=True)
-
-def pcm_to_wav(pcm_data: bytes, output_path: str, sample_rate: int = 24000, channels: int = 1, sample_width: int = 2):
-    """Convert raw PCM data to WAV format"""
-    with wave.open(output_path, 'wb') as wav_file:
-        wav_file.setnchannels(channels)
-        wav_file.setsampwidth(sample_width)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(pcm_data)
-
-def _combine_wav_files(wav_files: list, output_path: str):
-    """Combine multiple WAV files"""
-    if not wav_files:
-        raise Exception("No files to combine")
-    
-    # Read first file to get audio parameters
-    with wave.open(wav_files[0], 'rb') as first_wav:
-        params = first_wav.getparams()
-    
-    # Create output file
-    with wave.open(output_path, 'wb') as output_wav:
-        output_wav.setparams(params)
-        
-        # Merge files one by one
-        for wav_file in wav_files:
-            with wave.open(wav_file, 'rb') as input_wav:
-                output_wav.writeframes(input_wav.readframes(input_wav.getnframes()))
-    
-    print(f"🔗 Merge completed: {len(wav_files)} files → {output_path}")
 
-def _calculate_optimal_chunks(script: str, max_chunks: int = 15) -> int:
+@lru_cache(maxsize=1)
+def _ensure_podcasts_dir() -> Path:
+    """Create the output directory on first write instead of at import"""
+    PODCASTS_DIR.mkdir(parents=True, exist_ok=True)
+    return PODCASTS_DIR
+
+# Default target segment size. Longer inputs mean fewer API calls for the same audio;
+# segments that time out are re-split at FALLBACK_CHARS_PER_CHUNK
+CHARS_PER_CHUNK = settings.tts_chars_per_chunk
+FALLBACK_CHARS_PER_CHUNK = 1200
+
+# The segment size in use is tuned per model from past runs: an EWMA stored in Redis
+# that grows after clean runs and shrinks in proportion to segment timeouts
+CHUNK_SIZE_KEY = "tts:optimal_chars_per_chunk:"
+CHUNK_SIZE_EWMA_ALPHA = 0.2
+MAX_CHARS_PER_CHUNK = 2 * CHARS_PER_CHUNK
+
+# Start of a dialogue turn; used to split scripts between speakers
+_DIALOGUE_RE = re.compile(r'^[ \t]*(?:Joe|Jane):', re.MULTILINE)
+
+# TTS calls aimed for per podcast, to protect the daily quota. Segments grow towards
+# MAX_CHARS_PER_CHUNK to stay within it, but never past that: on very long scripts the
+# size limit wins. Streamed cuts switch to that size STREAM_RESERVED_SEGMENTS short of
+# the cap, since the script's final length isn't known yet
+MAX_TTS_SEGMENTS = 15
+STREAM_RESERVED_SEGMENTS = 3
+
+# Segments generated in parallel; each is an independent TTS API request.
+# The limit is shared by every podcast running on the same event loop
+MAX_CONCURRENT_CHUNKS = 4
+
+_loop_semaphores = weakref.WeakKeyDictionary()
+_loop_redis = weakref.WeakKeyDictionary()
+
+def _loop_local(registry: weakref.WeakKeyDictionary, factory):
+    """Per-event-loop singleton: asyncio primitives and clients can't be shared across loops"""
+    loop = asyncio.get_running_loop()
+    value = registry.get(loop)
+    if value is None:
+        value = registry[loop] = factory()
+    return value
+
+def _api_semaphore() -> asyncio.Semaphore:
+    """TTS concurrency limit for the running event loop"""
+    return _loop_local(_loop_semaphores, lambda: asyncio.Semaphore(MAX_CONCURRENT_CHUNKS))
+
+def _cache_client() -> aioredis.Redis:
+    """Redis client for small TTS bookkeeping keys (rate limits, tuning), one per event loop"""
+    return _loop_local(_loop_redis, lambda: aioredis.from_url(settings.redis_url))
+
+JOE_VOICE = 'charon'
+JANE_VOICE = 'aoede'
+
+# Per-API-key request counters for the current minute, shared by every worker process
+RATE_LIMIT_PREFIX = "tts:rate:"
+
+# Built once and shared by every TTS request
+_TTS_CONFIG = types.GenerateContentConfig(
+    response_modalities=["AUDIO"],
+    speech_config=types.SpeechConfig(
+        multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
+            speaker_voice_configs=[
+                types.SpeakerVoiceConfig(
+                    speaker='Joe',
+                    voice_config=types.VoiceConfig(
+                        prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=JOE_VOICE)
+                    )
+                ),
+                types.SpeakerVoiceConfig(
+                    speaker='Jane',
+                    voice_config=types.VoiceConfig(
+                        prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=JANE_VOICE)
+                    )
+                ),
+            ]
+        )
+    )
+)
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str) -> genai.Client:
+    """One client per API key, so its HTTP connection pool is reused across segments"""
+    return genai.Client(api_key=api_key)
+
+WAV_HEADER_SIZE = 44
+
+@lru_cache(maxsize=8)
+def _wav_header_template(sample_rate: int, channels: int, sample_width: int) -> bytes:
+    """44-byte RIFF/WAVE header for one audio format, with both size fields left at zero"""
+    block_align = channels * sample_width
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 0, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, sample_rate * block_align, block_align, sample_width * 8,
+        b'data', 0
+    )
+
+def wav_header(data_size: int, sample_rate: int = 24000, channels: int = 1, sample_width: int = 2) -> bytes:
+    """Canonical 44-byte RIFF/WAVE header for PCM data of data_size bytes"""
+    header = bytearray(_wav_header_template(sample_rate, channels, sample_width))
+    # Only the RIFF chunk size and the data chunk size depend on the payload
+    struct.pack_into('<I', header, 4, 36 + data_size)
+    struct.pack_into('<I', header, 40, data_size)
+    return bytes(header)
+
+def pcm_to_wav(pcm_data, output, sample_rate: int = 24000, channels: int = 1, sample_width: int = 2) -> int:
+    """
+    Convert raw PCM data to WAV format; pcm_data is any bytes-like object (memoryviews are written
+    without copying) or a list of segments written back to back,
+    output is a path or a binary file object. Returns the WAV size in bytes
+    """
+    parts = [pcm_data] if isinstance(pcm_data, (bytes, bytearray, memoryview)) else pcm_data
+    # nbytes, not len: a cast memoryview (e.g. of an int16 array) counts items, not bytes
+    data_size = sum(memoryview(part).nbytes for part in parts)
+    # Header written once with the final size, then the payloads streamed after it
+    header = wav_header(data_size, sample_rate, channels, sample_width)
+    if isinstance(output, (str, Path)):
+        with open(output, 'wb') as f:
+            f.write(header)
+            f.writelines(parts)
+    else:
+        output.write(header)
+        output.writelines(parts)
+    return WAV_HEADER_SIZE + data_size
+
+def _calculate_optimal_chunks(script: str, max_chunks: int = 15, chars_per_chunk: int = CHARS_PER_CHUNK) -> int:
     """
     Intelligently calculate optimal number of segments - limit to max_chunks API calls
     """
     script_length = len(script)
     
-    chars_per_chunk = 1200
-    
     # Calculate ideal number of segments
     ideal_chunks = (script_length + chars_per_chunk - 1) // chars_per_chunk
     
     # Limit maximum segments
     optimal_chunks = min(ideal_chunks, max_chunks)
     
-    print(f"📊 Script length: {script_length} characters")
-    print(f"💡 Ideal segments: {ideal_chunks} segments")
-    print(f"🎯 Actual segments: {optimal_chunks} segments (limit ≤{max_chunks})")
-    print(f"📏 Approx per segment: {script_length // optimal_chunks} characters")
+    logger.debug("📊 Script length: %d characters, ideal segments: %d, actual: %d (limit ≤%d), ~%d characters each",
+                 script_length, ideal_chunks, optimal_chunks, max_chunks, script_length // optimal_chunks)
     
     return optimal_chunks
 
@@ -63,67 +168,36 @@ def _split_script_intelligent(script: str, num_chunks: int) -> list:
     """
     Intelligent script splitting - split by natural dialogue boundaries
     """
-    print(f"✂️ Intelligently splitting script into {num_chunks} segments...")
+    logger.debug("✂️ Intelligently splitting script into %d segments...", num_chunks)
     
-    # Split by lines and preserve dialogue structure
-    lines = [line.strip() for line in script.split('\n') if line.strip()]
+    # Offsets of every line that opens a dialogue turn (Joe: or Jane:), in one regex pass
+    dialogue_starts = [m.start() for m in _DIALOGUE_RE.finditer(script)]
+    dialogue_count = len(dialogue_starts)
     
-    # Find all dialogue start positions (Joe: or Jane:)
-    dialogue_starts = []
-    for i, line in enumerate(lines):
-        if line.startswith('Joe:') or line.startswith('Jane:'):
-            dialogue_starts.append(i)
-    
-    if len(dialogue_starts) < num_chunks:
-        print(f"⚠️ Dialogue segments ({len(dialogue_starts)}) less than target segments ({num_chunks})")
-        print("📝 Using simple character splitting...")
+    if dialogue_count < num_chunks:
+        logger.info("⚠️ Dialogue segments (%d) less than target segments (%d), using simple character splitting",
+                    dialogue_count, num_chunks)
         return _split_script_by_chars(script, num_chunks)
     
-    # Calculate characters per segment
+    # Cut at the first dialogue turn at or after each k/num_chunks mark
     total_chars = len(script)
-    target_chars_per_chunk = total_chars // num_chunks
+    cuts = []
+    prev = 0
+    for k in range(1, num_chunks):
+        j = bisect_left(dialogue_starts, max(total_chars * k / num_chunks, prev + 1))
+        if j == dialogue_count:
+            break
+        prev = dialogue_starts[j]
+        cuts.append(prev)
     
     chunks = []
-    current_chunk_lines = []
-    current_chunk_chars = 0
-    dialogue_index = 0
-    
-    for i, line in enumerate(lines):
-        current_chunk_lines.append(line)
-        current_chunk_chars += len(line) + 1  # +1 for newline
-        
-        # Check if should end current chunk
-        should_end_chunk = False
-        
-        # Condition 1: reached target characters and current is end of dialogue
-        if (current_chunk_chars >= target_chars_per_chunk and 
-            i + 1 < len(lines) and 
-            (lines[i + 1].startswith('Joe:') or lines[i + 1].startswith('Jane:'))):
-            should_end_chunk = True
-        
-        # Condition 2: generated enough segments, put remaining content in last segment
-        if len(chunks) == num_chunks - 1:
-            should_end_chunk = False  # Last segment contains all remaining content
-        
-        # Condition 3: current segment too long, force split
-        if current_chunk_chars > target_chars_per_chunk * 1.5:
-            should_end_chunk = True
-        
-        if should_end_chunk and len(chunks) < num_chunks - 1:
-            chunk_text = '\n'.join(current_chunk_lines)
+    for lo, hi in zip([0] + cuts, cuts + [total_chars]):
+        chunk_text = script[lo:hi].strip()
+        if chunk_text:
             chunks.append(chunk_text)
-            print(f"📋 Segment {len(chunks)}: {len(chunk_text)} characters")
-            
-            current_chunk_lines = []
-            current_chunk_chars = 0
-    
-    # Add last segment
-    if current_chunk_lines:
-        final_chunk = '\n'.join(current_chunk_lines)
-        chunks.append(final_chunk)
-        print(f"📋 Segment {len(chunks)} (last): {len(final_chunk)} characters")
+            logger.debug("📋 Segment %d: %d characters", len(chunks), len(chunk_text))
     
-    print(f"✅ Intelligent splitting completed: {len(chunks)} segments")
+    logger.debug("✅ Intelligent splitting completed: %d segments", len(chunks))
     return chunks
 
 def _split_script_by_chars(script: str, num_chunks: int) -> list:
@@ -148,177 +222,335 @@ def _split_script_by_chars(script: str, num_chunks: int) -> list:
         chunk = script[start:end].strip()
         if chunk:
             chunks.append(chunk)
-            print(f"📋 Segment {len(chunks)}: {len(chunk)} characters")
+            logger.debug("📋 Segment %d: %d characters", len(chunks), len(chunk))
     
     return chunks
 
-def _generate_single_chunk(script: str, output_filename: str, api_key: str = None) -> str:
+async def _acquire_request_slot(api_key: str):
+    """
+    Wait for a slot in this API key's per-minute TTS budget. Requests are counted in
+    fixed one-minute windows in Redis, so the limit holds across all worker processes
+    """
+    key_id = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+    while True:
+        now = time.time()
+        window = int(now // 60)
+        key = f"{RATE_LIMIT_PREFIX}{key_id}:{window}"
+        try:
+            pipe = _cache_client().pipeline(transaction=True)
+            pipe.incr(key)
+            pipe.expire(key, 120)
+            count, _ = await pipe.execute()
+        except Exception as e:
+            logger.warning("⚠️ Rate limiter unavailable, not pacing this request: %s", e)
+            return
+        if count <= settings.tts_requests_per_minute:
+            return
+        # Budget spent: wait for the next window, jittered so waiters don't all fire at once
+        await asyncio.sleep((window + 1) * 60 - now + random.uniform(0, 1))
+
+def _split_for_tts(script: str, chars_per_chunk: int, max_segments: int = MAX_TTS_SEGMENTS) -> list:
+    """
+    Split a script evenly into segments of about chars_per_chunk, at most max_segments
+    of them unless that would make a segment longer than MAX_CHARS_PER_CHUNK
+    """
+    num_chunks = max(
+        _calculate_optimal_chunks(script, max_segments, chars_per_chunk),
+        -(-len(script) // MAX_CHARS_PER_CHUNK)
+    )
+    # Cuts land on dialogue turns and can overshoot by up to a turn; add segments until they fit,
+    # giving up once the average is half the limit (a single turn that long can't be helped)
+    while True:
+        chunks = _split_script_intelligent(script, num_chunks) if num_chunks > 1 else [script]
+        if max(map(len, chunks)) <= MAX_CHARS_PER_CHUNK or num_chunks * MAX_CHARS_PER_CHUNK >= 2 * len(script):
+            return chunks
+        num_chunks += 1
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=1, max=8),
+    retry=retry_if_exception_type((TimeoutError, ConnectionError, httpx.TransportError, genai_errors.ServerError)),
+    reraise=True,
+)
+async def _request_audio(client: genai.Client, api_key: str, script: str):
+    """TTS API call, retried with jittered backoff on transient network/server errors"""
+    # Every attempt, retries included, spends a request from the per-minute budget
+    await _acquire_request_slot(api_key)
+    return await client.aio.models.generate_content(
+        model=settings.tts_model_name,
+        contents=[script],
+        config=_TTS_CONFIG
+    )
+
+def _pcm_from_response(response) -> bytes:
+    """Audio bytes from a TTS response, walking the candidate/content/part chain once"""
+    candidates = response.candidates
+    content = candidates[0].content if candidates else None
+    parts = content.parts if content else None
+    inline_data = parts[0].inline_data if parts else None
+    if inline_data is None or not inline_data.data:
+        raise Exception("No audio data in API response")
+    return inline_data.data
+
+async def _generate_single_chunk(script: str, api_key: str = None) -> bytes:
     """
     Generate single audio segment - Use non-streaming API for better stability
+    Returns the raw PCM data; segments are only written to disk once merged
     """
     # Use user's API key if provided, otherwise fall back to system default
     google_api_key = api_key or settings.google_api_key
-    client = genai.Client(api_key=google_api_key)
+    client = _get_client(google_api_key)
     
     try:
-        print(f"🎵 Generating audio segment: {len(script)} characters")
+        logger.debug("🎵 Generating audio segment: %d characters", len(script))
         start_time = time.time()
         
         # Use non-streaming API (suitable for short segments, more stable)
-        response = client.models.generate_content(
-            model=settings.tts_model_name,
-            contents=[script],
-            config=types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
-                        speaker_voice_configs=[
-                            types.SpeakerVoiceConfig(
-                                speaker='Joe',
-                                voice_config=types.VoiceConfig(
-                                    prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name='charon')
-                                )
-                            ),
-                            types.SpeakerVoiceConfig(
-                                speaker='Jane',
-                                voice_config=types.VoiceConfig(
-                                    prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name='aoede')
-                                )
-                            ),
-                        ]
-                    )
-                )
-            )
-        )
+        response = await _request_audio(client, google_api_key, script)
         
         elapsed_time = time.time() - start_time
-        print(f"✅ API response time: {elapsed_time:.2f} seconds")
-        
-        # Extract audio data
-        if (not response.candidates or 
-            not response.candidates[0].content.parts or
-            not hasattr(response.candidates[0].content.parts[0], 'inline_data')):
-            raise Exception("No audio data in API response")
-        
-        audio_data = response.candidates[0].content.parts[0].inline_data.data
-        
-        # Save audio file
-        if not output_filename.endswith('.wav'):
-            output_filename = output_filename.rsplit('.', 1)[0] + '.wav'
+        logger.debug("✅ API response time: %.2f seconds for %d characters", elapsed_time, len(script))
         
-        output_path = PODCASTS_DIR / output_filename
-        pcm_to_wav(audio_data, str(output_path))
+        audio_data = _pcm_from_response(response)
+        logger.debug("💾 Audio segment generated: %d bytes PCM", len(audio_data))
         
-        file_size = output_path.stat().st_size / 1024  # KB
-        print(f"💾 Audio segment saved: {output_path} ({file_size:.1f} KB)")
-        
-        return str(output_path)
+        return audio_data
         
     except Exception as e:
         error_msg = str(e)
-        print(f"❌ Audio segment generation failed: {error_msg}")
-        raise Exception(f"Segment generation failed: {error_msg}")
+        logger.warning("❌ Audio segment generation failed: %s", error_msg)
+        raise Exception(f"Segment generation failed: {error_msg}") from e
+
+def _timed_out(e: BaseException) -> bool:
+    """Whether a timeout appears anywhere in an exception's cause/context chain"""
+    while e is not None:
+        # httpx timeouts (the GenAI client's transport) aren't TimeoutError subclasses
+        if isinstance(e, (TimeoutError, httpx.TimeoutException)):
+            return True
+        e = e.__cause__ or e.__context__
+    return False
 
-def _generate_audio_sync(script: str, output_filename: str, api_key: str = None) -> str:
+async def _synthesize_with_fallback(script: str, api_key: str = None) -> tuple:
     """
-    Intelligent segmented TTS generation - Automatically calculate optimal number of segments
+    _generate_single_chunk, but a segment that times out is re-split into
+    FALLBACK_CHARS_PER_CHUNK pieces and generated piece by piece.
+    Returns (pcm_data, timed_out)
     """
-    print(f"🎬 Starting intelligent segmented audio generation: {len(script)} characters")
-    
-    # Intelligently calculate number of segments (max 10 segments to protect quota)
-    num_chunks = _calculate_optimal_chunks(script, max_chunks=15)
+    try:
+        return await _generate_single_chunk(script, api_key), False
+    except Exception as e:
+        if not _timed_out(e) or len(script) <= FALLBACK_CHARS_PER_CHUNK:
+            raise
+        parts = _split_script_intelligent(
+            script, _calculate_optimal_chunks(script, chars_per_chunk=FALLBACK_CHARS_PER_CHUNK)
+        )
+        logger.warning("⏱️ Segment of %d characters timed out, retrying as %d smaller segments", len(script), len(parts))
+        # Still inside the except block, so a failure here keeps the timeout as its __context__
+        results = [await _generate_single_chunk(part, api_key) for part in parts]
+    return b''.join(results), True
+
+def _podcast_path(output_filename: str) -> Path:
+    """Final WAV path for a podcast, creating the output directory if needed"""
+    if not output_filename.endswith('.wav'):
+        output_filename = output_filename.rsplit('.', 1)[0] + '.wav'
+    return _ensure_podcasts_dir() / output_filename
+
+def _bounded_segment_generator(api_key: str = None):
+    """
+    Segment generator for one podcast: runs under the loop-wide semaphore and
+    stops starting new segments once a segment reports the quota is exhausted
+    """
+    semaphore = _api_semaphore()
+    quota_exhausted = False
+    
+    async def bounded_generate(i: int, chunk: str) -> tuple:
+        nonlocal quota_exhausted
+        async with semaphore:
+            # Don't start new segments once the quota is gone
+            if quota_exhausted:
+                raise Exception("Skipped: TTS quota exhausted")
+            
+            logger.debug("🎯 Processing segment %d...", i + 1)
+            try:
+                return await _synthesize_with_fallback(chunk, api_key)
+            except Exception as e:
+                error_msg = str(e)
+                logger.warning("❌ Segment %d failed: %s", i + 1, error_msg)
+                
+                if "quota" in error_msg.lower() or "resource_exhausted" in error_msg.lower():
+                    logger.warning("🚫 Quota exhausted, stopping processing")
+                    quota_exhausted = True
+                raise
     
-    print(f"💎 Will consume {num_chunks} TTS quota calls (total 15/day)")
+    return bounded_generate
+
+async def _tuned_chars_per_chunk() -> int:
+    """Segment size learned from previous runs of this model, or the configured default"""
+    try:
+        value = await _cache_client().get(CHUNK_SIZE_KEY + settings.tts_model_name)
+        if value:
+            return int(float(value))
+    except Exception as e:
+        logger.debug("⚠️ Segment size lookup failed: %s", e)
+    return CHARS_PER_CHUNK
+
+async def _record_chunk_outcome(chars_per_chunk: int, results: list):
+    """Fold one podcast's segment timeouts into the tuned segment size"""
+    segments = len(results)
+    # A single-segment podcast was shorter than chars_per_chunk, so it says nothing about that size
+    if segments < 2:
+        return
+    failures = sum(1 for r in results if isinstance(r, BaseException))
+    # A segment timed out if it was re-split, or if it failed with a timeout anywhere in its chain
+    timeouts = sum(
+        _timed_out(r) if isinstance(r, BaseException) else r[1]
+        for r in results
+    )
+    
+    # Back off in proportion to the share of timeouts; probe upward only after a fully clean run
+    if timeouts:
+        sample = chars_per_chunk * (segments - timeouts) / segments
+    elif failures:
+        return
+    else:
+        sample = chars_per_chunk * 1.1
+    tuned = (1 - CHUNK_SIZE_EWMA_ALPHA) * chars_per_chunk + CHUNK_SIZE_EWMA_ALPHA * sample
+    tuned = min(max(tuned, FALLBACK_CHARS_PER_CHUNK), MAX_CHARS_PER_CHUNK)
+    try:
+        await _cache_client().set(CHUNK_SIZE_KEY + settings.tts_model_name, round(tuned))
+        logger.debug("📐 Segment size %d -> %d (%d/%d timed out)", chars_per_chunk, tuned, timeouts, segments)
+    except Exception as e:
+        logger.debug("⚠️ Segment size update failed: %s", e)
+
+async def _write_podcast(results: list, final_output: Path, chars_per_chunk: int) -> str:
+    """Merge the successful segment results, in order, into the final WAV file"""
+    # return_exceptions keeps partial success: failed segments are dropped, order is preserved
+    pcm_parts = [r[0] for r in results if not isinstance(r, BaseException)]
+    failed_chunks = [i + 1 for i, r in enumerate(results) if isinstance(r, BaseException)]
     
-    if num_chunks == 1:
-        print("📝 Script is short, using single call...")
-        try:
-            return _generate_single_chunk(script, output_filename, api_key)
-        except Exception as e:
-            if "timeout" in str(e).lower() or "disconnected" in str(e).lower():
-                print("⚠️ Single call timeout, forcing split into 2 segments...")
-                num_chunks = 2
-            else:
-                raise e
+    await _record_chunk_outcome(chars_per_chunk, results)
     
-    # Intelligently split script
-    chunks = _split_script_intelligent(script, num_chunks)
+    # Check results
+    if not pcm_parts:
+        raise Exception("All audio segments generation failed") from results[0]
     
-    if len(chunks) != num_chunks:
-        print(f"⚠️ Actual segments ({len(chunks)}) don't match plan ({num_chunks})")
+    if failed_chunks:
+        logger.warning("⚠️ Failed segments: %s (%d/%d succeeded)", failed_chunks, len(pcm_parts), len(results))
     
-    # Generate audio segments
-    chunk_files = []
-    failed_chunks = []
+    # Write the segments straight after one header, without joining them first
+    wav_bytes = await asyncio.to_thread(pcm_to_wav, pcm_parts, final_output)
     
-    print(f"🎵 Starting generation of {len(chunks)} audio segments...")
+    file_size = wav_bytes / 1024 / 1024  # MB
+    logger.info("🎉 Podcast audio completed: %s (%.1f MB), %d/%d segments, %d TTS quota calls",
+                final_output, file_size, len(pcm_parts), len(results), len(pcm_parts))
     
-    for i, chunk in enumerate(chunks):
-        chunk_filename = f"chunk_{i+1:02d}_{output_filename}"
-        
-        try:
-            print(f"\n🎯 Processing segment {i+1}/{len(chunks)}...")
-            chunk_path = _generate_single_chunk(chunk, chunk_filename, api_key)
-            chunk_files.append(chunk_path)
-            
-            # API call interval (avoid rate limiting)
-            if i < len(chunks) - 1:
-                print("⏱️ Waiting 3 seconds to avoid API limits...")
-                time.sleep(3)
-                
-        except Exception as e:
-            error_msg = str(e)
-            print(f"❌ Segment {i+1} failed: {error_msg}")
-            failed_chunks.append(i+1)
-            
-            # Stop immediately if quota issue
-            if "quota" in error_msg.lower() or "resource_exhausted" in error_msg.lower():
-                print("🚫 Quota exhausted, stopping processing")
-                break
-            
-            # Continue with next segment for other errors
-            continue
-    
-    # Check results
-    if not chunk_files:
-        raise Exception("All audio segments generation failed")
+    return str(final_output)
+
+async def generate_podcast_audio_streaming(script_stream, output_filename: str, api_key: str = None) -> str:
+    """
+    Generate podcast audio while the script is still being written: as soon as about
+    a segment's worth of complete dialogue turns has arrived it is sent to TTS
+    """
+    logger.info("🎬 Starting streamed audio generation")
     
-    if failed_chunks:
-        print(f"⚠️ Failed segments: {failed_chunks}")
-        print(f"✅ Successful segments: {len(chunk_files)}/{len(chunks)}")
+    chars_per_chunk = await _tuned_chars_per_chunk()
     
-    # Merge audio files
-    if not output_filename.endswith('.wav'):
-        output_filename = output_filename.rsplit('.', 1)[0] + '.wav'
+    final_output = _podcast_path(output_filename)
+    generate = _bounded_segment_generator(api_key)
+    tasks = []
+    buffer = ""
     
-    final_output = PODCASTS_DIR / output_filename
-    _combine_wav_files(chunk_files, str(final_output))
+    def submit(text: str):
+        text = text.strip()
+        if text:
+            tasks.append(asyncio.create_task(generate(len(tasks), text)))
     
-    # Clean up temporary files
-    for chunk_file in chunk_files:
+    try:
+        async for piece in script_stream:
+            buffer += piece
+            # Near the segment cap, cut at the largest allowed size so the rest of the script still fits
+            if len(tasks) < MAX_TTS_SEGMENTS - STREAM_RESERVED_SEGMENTS:
+                target = chars_per_chunk
+            else:
+                target = MAX_CHARS_PER_CHUNK
+            if len(buffer) < target:
+                continue
+            # Cut at the last dialogue turn that keeps the segment within target; the turn
+            # after a cut may still be incomplete. A turn straddling the target ends the segment
+            starts = [m.start() for m in _DIALOGUE_RE.finditer(buffer)]
+            j = bisect_right(starts, target)
+            if j and starts[j - 1] >= target // 2:
+                cut = starts[j - 1]
+            elif j < len(starts):
+                cut = starts[j]
+            else:
+                continue
+            submit(buffer[:cut])
+            buffer = buffer[cut:]
+        
+        # Split the tail evenly against what's left of the segment budget
+        if buffer.strip():
+            budget = max(MAX_TTS_SEGMENTS - len(tasks), 1)
+            for chunk in _split_for_tts(buffer.strip(), chars_per_chunk, budget):
+                submit(chunk)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    
+    if not tasks:
+        raise Exception("Script stream produced no text")
+    
+    logger.info("🎵 Script complete, waiting for %d audio segments...", len(tasks))
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    return await _write_podcast(results, final_output, chars_per_chunk)
+
+def _api_error(e: BaseException):
+    """The GenAI API error behind a (possibly wrapped) exception, if any"""
+    while e is not None:
+        if isinstance(e, genai_errors.APIError):
+            return e
+        e = e.__cause__
+    return None
+
+def _retry_delay(e: BaseException, attempt: int):
+    """
+    Seconds to wait before retrying, or None if the error won't go away on retry.
+    4xx errors other than 429 are final; a 429's Retry-After is honoured
+    """
+    api_error = _api_error(e)
+    if isinstance(api_error, genai_errors.ClientError):
+        if api_error.code != 429:
+            return None
+        headers = getattr(api_error.response, 'headers', None) or {}
         try:
-            Path(chunk_file).unlink()
-            print(f"🗑️ Cleaned temp file: {Path(chunk_file).name}")
-        except:
+            return float(headers.get('Retry-After'))
+        except (TypeError, ValueError):
             pass
-    
-    file_size = final_output.stat().st_size / 1024 / 1024  # MB
-    print(f"\n🎉 Intelligent segmentation processing completed!")
-    print(f"💾 Final file: {final_output} ({file_size:.1f} MB)")
-    print(f"💰 Total consumed: {len(chunk_files)} TTS quota calls")
-    print(f"📊 Success rate: {len(chunk_files)}/{len(chunks)} ({len(chunk_files)/len(chunks)*100:.1f}%)")
-    
-    return str(final_output)
+    # Exponential backoff with jitter so concurrent workers don't retry in lockstep
+    return min(30, 2 ** attempt) + random.uniform(0, 1)
 
-# Async wrapper - compatible with existing code
 async def generate_podcast_audio(script: str, output_filename: str, api_key: str = None) -> str:
-    """Async wrapper"""
-    from fastapi.concurrency import run_in_threadpool
-    return await run_in_threadpool(_generate_audio_sync, script, output_filename, api_key)
-
-def estimate_tokens(text: str) -> int:
-    """Estimate token count for text"""
-    return len(text.split()) * 1.3
+    """
+    Generate podcast audio for a complete script; its length is known, so it is
+    split evenly up front, generating up to MAX_CONCURRENT_CHUNKS segments at a time
+    """
+    script = script.strip()
+    if not script:
+        raise Exception("Script is empty")
+    
+    logger.info("🎬 Starting segmented audio generation: %d characters", len(script))
+    
+    chars_per_chunk = await _tuned_chars_per_chunk()
+    chunks = _split_for_tts(script, chars_per_chunk)
+    logger.info("💎 Will consume %d TTS quota calls", len(chunks))
+    
+    generate = _bounded_segment_generator(api_key)
+    results = await asyncio.gather(
+        *(generate(i, chunk) for i, chunk in enumerate(chunks)),
+        return_exceptions=True
+    )
+    return await _write_podcast(results, _podcast_path(output_filename), chars_per_chunk)
 
 async def generate_podcast_audio_with_retry(
     script: str, 
@@ -337,11 +569,18 @@ async def generate_podcast_audio_with_retry(
                     detail="TTS quota exhausted. Please try tomorrow."
                 )
             
+            delay = _retry_delay(e, attempt)
+            if delay is None:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Audio generation failed: {str(e)}"
+                )
+            
             if attempt == max_retries - 1:
                 raise HTTPException(
                     status_code=500,
                     detail=f"Audio generation failed after {max_retries} attempts: {str(e)}"
                 )
             
-            print(f"⚠️ Attempt {attempt + 1} failed, retrying...")
-            await asyncio.sleep(5)
\ No newline at end of file
+            logger.warning("⚠️ Attempt %d failed, retrying in %.1f seconds...", attempt + 1, delay)
+            await asyncio.sleep(delay)
\ No newline at end of file
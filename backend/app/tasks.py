@@ -1,18 +1,24 @@
 from celery import current_task
+from celery.signals import worker_process_init
 from app.celery_app import celery_app
 from app.services import script_writer, tts_service
 from app import models
 from app.config import settings
-from sqlalchemy import create_engine, select
+from sqlalchemy import bindparam, create_engine, select, update
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 import asyncio
-import os
+import logging
+from pathlib import Path
+import threading
+import time
+
+logger = logging.getLogger(__name__)
 
 def get_sync_database_url():
     """Convert async database URL to sync version"""
     url = settings.database_url
-    print(f"🔍 Original database URL: {url[:50]}...")
+    logger.debug("🔍 Original database URL: %s...", url[:50])
     
     # Convert to psycopg2 format (sync version)
     if "postgresql+psycopg://" in url:
@@ -24,7 +30,7 @@ def get_sync_database_url():
         # Other cases, try to clean to basic format
         sync_url = url.replace("postgresql+psycopg://", "postgresql://")
     
-    print(f"🔄 Converted URL: {sync_url[:50]}...")
+    logger.debug("🔄 Converted URL: %s...", sync_url[:50])
     return sync_url
 
 # Initialize sync database connection for Celery
@@ -41,67 +47,153 @@ try:
         }
     )
     SyncSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
-    print(f"✅ Sync database engine created successfully")
+    logger.info("✅ Sync database engine created successfully")
 except Exception as e:
-    print(f"❌ Failed to create sync database engine: {e}")
-    print(f"🔧 Please check if psycopg2-binary is installed")
+    logger.error("❌ Failed to create sync database engine: %s", e)
+    logger.error("🔧 Please check if psycopg2-binary is installed")
     sync_engine = None
     SyncSessionLocal = None
 
+# Built once; only the bound values change per task
+_update_podcast_stmt = (
+    update(models.Podcast)
+    .where(models.Podcast.id == bindparam('podcast_id'))
+    .values(
+        script=bindparam('new_script'),
+        audio_file_path=bindparam('new_audio_file_path'),
+        status=bindparam('new_status'),
+        generated_at=bindparam('new_generated_at'),
+    )
+)
+
+# One long-lived event loop per worker process. The cached GenAI clients (and the
+# Redis client) keep async connection pools bound to the loop that first used them;
+# asyncio.run() would close that loop after every task and break them for the next
+_worker_loop = None
+_worker_loop_lock = threading.Lock()
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared event loop on a daemon thread on first use"""
+    global _worker_loop
+    with _worker_loop_lock:
+        if _worker_loop is None or _worker_loop.is_closed():
+            _worker_loop = asyncio.new_event_loop()
+            threading.Thread(target=_worker_loop.run_forever, name="worker-event-loop", daemon=True).start()
+        return _worker_loop
+
+@worker_process_init.connect
+def _start_worker_loop(**kwargs):
+    """Forked children don't inherit the loop thread, so start a fresh loop in each"""
+    global _worker_loop
+    _worker_loop = None
+    _get_worker_loop()
+
+def run_on_worker_loop(coro):
+    """Run a coroutine on the shared worker loop and block until it finishes"""
+    future = asyncio.run_coroutine_threadsafe(coro, _get_worker_loop())
+    try:
+        return future.result()
+    except BaseException:
+        # Soft time limit, revoke or any other interruption: stop the coroutine too,
+        # so it doesn't keep spending TTS quota after the task has failed
+        future.cancel()
+        raise
+
+async def _generate_script_and_audio(articles_data: list, audio_filename: str, api_key: str = None):
+    """
+    Stream the script straight into TTS so the two overlap.
+    Returns (script, audio_path); audio_path is empty if audio generation failed
+    """
+    script_parts = []
+    stream_error = None
+    
+    async def script_stream():
+        nonlocal stream_error
+        try:
+            async for text in script_writer.stream_script_from_articles(articles_data, api_key=api_key):
+                script_parts.append(text)
+                yield text
+        except Exception as e:
+            stream_error = e
+            raise
+    
+    stream = script_stream()
+    try:
+        audio_path = await tts_service.generate_podcast_audio_streaming(stream, audio_filename, api_key=api_key)
+        logger.info("✅ Audio generation completed: %s", audio_path)
+    except Exception as audio_error:
+        logger.warning("⚠️ Audio generation failed: %s", audio_error)
+        # Continue with script-only podcast
+        audio_path = ""
+    
+    # Audio may have failed before the script was finished; collect the rest of it
+    try:
+        async for _ in stream:
+            pass
+    except Exception:
+        # Recorded in stream_error
+        pass
+    
+    if stream_error is None:
+        return "".join(script_parts).strip(), audio_path
+    
+    # The script broke off mid-stream, which also failed the streamed audio:
+    # ship the fallback briefing instead of the truncated one
+    logger.warning("⚠️ Script stream failed, using fallback script: %s", stream_error)
+    script = script_writer.create_fallback_morning_script(articles_data)
+    try:
+        audio_path = await tts_service.generate_podcast_audio(script, audio_filename, api_key=api_key)
+    except Exception as audio_error:
+        logger.warning("⚠️ Audio generation failed: %s", audio_error)
+        audio_path = ""
+    return script, audio_path
+
 @celery_app.task(bind=True)
 def generate_podcast_task(self, podcast_id: int, user_id: int, articles_data: list):
     """Generate podcast Celery task - Complete sync version with fixed field names"""
     try:
-        print(f"🎙️ Starting podcast generation, Podcast ID: {podcast_id}")
+        logger.info("🎙️ Starting podcast generation, Podcast ID: %s", podcast_id)
         
         # Check database connection
         if not SyncSessionLocal:
             raise Exception("Database connection not available in Celery worker")
         
-        # Get user's Google API key from settings
-        user_google_api_key = None
+        # Get user's Google API key and check the podcast exists in one round trip;
+        # the session is closed again before the long LLM/TTS calls
         with SyncSessionLocal() as db:
-            user_settings_query = select(models.UserSettings).filter(models.UserSettings.user_id == user_id)
-            user_settings = db.execute(user_settings_query).scalars().first()
-            if user_settings and user_settings.google_api_key:
-                user_google_api_key = user_settings.google_api_key
-                print(f"✅ Using user's Google API key")
-            else:
-                print(f"⚠️ No user API key found, using system default")
+            user_google_api_key, podcast_exists = db.execute(select(
+                select(models.UserSettings.google_api_key)
+                .where(models.UserSettings.user_id == user_id)
+                .scalar_subquery(),
+                select(models.Podcast.id).where(models.Podcast.id == podcast_id).exists(),
+            )).one()
         
-        self.update_state(
-            state='PROGRESS',
-            meta={'current': 10, 'total': 100, 'status': 'Generating script...'}
-        )
-        
-        # 1. Generate script with user's API key
-        print(f"📝 Starting script generation for {len(articles_data)} articles...")
-        script = script_writer.generate_script_from_articles(articles_data, api_key=user_google_api_key)
-        
-        if not script:
-            raise Exception("Script generation failed")
-        
-        print(f"✅ Script generation completed: {len(script)} characters")
+        if user_google_api_key:
+            logger.debug("✅ Using user's Google API key")
+        else:
+            logger.debug("⚠️ No user API key found, using system default")
+        if not podcast_exists:
+            logger.warning("⚠️ Podcast %s not found yet, continuing", podcast_id)
         
-        # Update progress: Script completed
         self.update_state(
             state='PROGRESS',
-            meta={'current': 40, 'total': 100, 'status': 'Script generated, creating audio...'}
+            meta={'current': 10, 'total': 100, 'status': 'Generating script and audio...'}
         )
         
-        # 2. Generate audio
-        print(f"🎵 Starting audio generation...")
+        # 1-2. Generate script and audio together: TTS starts on the first dialogue turns
+        # while the rest of the script is still being written
+        logger.info("📝 Starting script and audio generation for %d articles...", len(articles_data))
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         audio_filename = f"podcast_{podcast_id}_{user_id}_{timestamp}.wav"
         
-        try:
-            # Run TTS generation in asyncio context with user's API key
-            audio_path = asyncio.run(tts_service.generate_podcast_audio(script, audio_filename, api_key=user_google_api_key))
-            print(f"✅ Audio generation completed: {audio_path}")
-        except Exception as audio_error:
-            print(f"⚠️ Audio generation failed: {audio_error}")
-            # Continue with script-only podcast
-            audio_path = ""
+        script, audio_path = run_on_worker_loop(
+            _generate_script_and_audio(articles_data, audio_filename, user_google_api_key)
+        )
+        
+        if not script:
+            raise Exception("Script generation failed")
+        
+        logger.info("✅ Script generation completed: %d characters", len(script))
         
         # Update progress: Audio completed
         self.update_state(
@@ -116,48 +208,38 @@ def generate_podcast_task(self, podcast_id: int, user_id: int, articles_data: li
             for attempt in range(max_retries):
                 try:
                     with SyncSessionLocal() as db:
-                        print(f"🔍 Looking for podcast ID: {podcast_id} (attempt {attempt + 1})")
+                        logger.debug("🔍 Updating podcast ID: %s (attempt %d)", podcast_id, attempt + 1)
                         
-                        # Query podcast record using sync session
-                        podcast_query = select(models.Podcast).where(models.Podcast.id == podcast_id)
-                        result = db.execute(podcast_query)
-                        podcast = result.scalar_one_or_none()
+                        # Single UPDATE, no prior SELECT of the row
+                        result = db.execute(_update_podcast_stmt, {
+                            'podcast_id': podcast_id,
+                            'new_script': script,
+                            'new_audio_file_path': audio_path if audio_path else "",
+                            'new_status': "completed" if audio_path else "script_only",
+                            'new_generated_at': datetime.utcnow(),
+                        })
                         
-                        if not podcast:
-                            # Debug: List recent podcasts to see what exists
-                            recent_podcasts = db.execute(
-                                select(models.Podcast.id, models.Podcast.title, models.Podcast.created_at)
-                                .order_by(models.Podcast.created_at.desc())
-                                .limit(5)
-                            ).fetchall()
-                            print(f"❌ Podcast {podcast_id} not found. Recent podcasts: {[(p.id, p.title, p.created_at) for p in recent_podcasts]}")
-                            
-                            if attempt < max_retries - 1:
-                                print(f"⏳ Retrying in 3 seconds...")
-                                import time
-                                time.sleep(3)
-                                continue
+                        if result.rowcount == 0:
+                            logger.error("❌ Podcast %s not found", podcast_id)
+                            if logger.isEnabledFor(logging.DEBUG):
+                                # Debug: List recent podcasts to see what exists
+                                recent_podcasts = db.execute(
+                                    select(models.Podcast.id, models.Podcast.title, models.Podcast.created_at)
+                                    .order_by(models.Podcast.created_at.desc())
+                                    .limit(5)
+                                ).fetchall()
+                                logger.debug("🔍 Recent podcasts: %s", [(p.id, p.title, p.created_at) for p in recent_podcasts])
+                            # A missing row won't appear by waiting; only errors are retried
                             return False
                         
-                        print(f"✅ Found podcast: {podcast.id} - {podcast.title}")
-                        
-                        # Update podcast fields
-                        podcast.script = script
-                        podcast.audio_file_path = audio_path if audio_path else ""
-                        podcast.status = "completed" if audio_path else "script_only"
-                        podcast.generated_at = datetime.utcnow()
-                        
                         # Commit changes
                         db.commit()
-                        print(f"✅ Database updated successfully")
+                        logger.debug("✅ Database updated successfully")
                         return True
                         
                 except Exception as db_error:
-                    print(f"❌ Database update failed (attempt {attempt + 1}/{max_retries}): {db_error}")
-                    import traceback
-                    traceback.print_exc()
+                    logger.exception("❌ Database update failed (attempt %d/%d): %s", attempt + 1, max_retries, db_error)
                     if attempt < max_retries - 1:
-                        import time
                         time.sleep(3)
                     continue
             
@@ -167,16 +249,16 @@ def generate_podcast_task(self, podcast_id: int, user_id: int, articles_data: li
         success = update_podcast_record()
         
         if success:
+            has_audio = bool(audio_path) and Path(audio_path).is_file()
             result = {
                 'podcast_id': podcast_id,
                 'audio_path': audio_path,
                 'script_length': len(script),
                 'status': 'completed' if audio_path else 'script_only',
-                'has_audio': bool(audio_path and os.path.exists(audio_path))
+                'has_audio': has_audio
             }
             
-            print(f"🎉 Podcast generation completed!")
-            print(f"📊 Result: {result}")
+            logger.info("🎉 Podcast generation completed: %s", result)
             
             return result
         else:
@@ -184,7 +266,7 @@ def generate_podcast_task(self, podcast_id: int, user_id: int, articles_data: li
             
     except Exception as e:
         error_message = str(e)
-        print(f"❌ Task failed: {error_message}")
+        logger.error("❌ Task failed: %s", error_message)
         
         self.update_state(
             state='FAILURE',